@@ -431,7 +431,13 @@ class SingleAssetHftBacktest:
                     or (next_local_timestamp > 0 >= next_exch_timestamp):
                 if next_local_timestamp > timestamp:
                     break
-                resp_timestamp = self.local.process(WAIT_ORDER_RESPONSE_NONE)
+                # Processing the local doesn't change the exchange's next timestamp, so the local events preceding the
+                # exchange's next event are processed in a batch without reevaluating the exchange's next timestamp.
+                resp_timestamp = self.local.process_batch(
+                    WAIT_ORDER_RESPONSE_NONE,
+                    timestamp,
+                    next_exch_timestamp
+                )
 
             # Exchange will be processed.
             elif (0 < next_exch_timestamp <= next_local_timestamp) \
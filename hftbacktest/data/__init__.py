@@ -19,7 +19,7 @@ __all__ = (
 )
 
 
-@njit
+@njit(cache=True)
 def merge_on_local_timestamp(a: NDArray, b: NDArray) -> NDArray:
     """
     Merges two data based on local timestamp.
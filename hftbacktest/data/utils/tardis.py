@@ -1,42 +1,390 @@
 import gzip
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Literal
 
 import numpy as np
+from numba import njit, literally, objmode
 from numpy.typing import NDArray
 
-from .. import merge_on_local_timestamp, correct, validate_data
+from .. import correct, validate_data
 from ... import DEPTH_CLEAR_EVENT, DEPTH_SNAPSHOT_EVENT, TRADE_EVENT, DEPTH_EVENT
 
 
-def convert(
-        input_files: List[str],
-        output_filename: Optional[str] = None,
-        buffer_size: int = 100_000_000,
-        ss_buffer_size: int = 10_000,
-        base_latency: float = 0,
-        method: Literal['separate', 'adjust'] = 'separate',
-        snapshot_mode: Literal['process', 'ignore_sod', 'ignore'] = 'process'
-) -> NDArray:
-    """
-    Converts Tardis.dev data files into a format compatible with HftBacktest.
+TRADE = 0
+DEPTH = 1
+
+SNAPSHOT_MODES = {
+    'process': 0,
+    'ignore_sod': 1,
+    'ignore': 2
+}
+
+# The size of the blocks in which the decompressed files are read.
+READ_BLOCK_SIZE = 1 << 20
+
+NEWLINE = ord('\n')
+COMMA = ord(',')
+
+TRUE = np.frombuffer(b'true', np.uint8)
+
+# Maps the first byte of the side column to the side, so 'buy' and 'bid' are 1, and the others are -1.
+SIDE = np.full(256, -1, np.int8)
+SIDE[ord('b')] = 1
+
+# Exactly representable powers of ten. A decimal whose digits fit in the 53-bit mantissa and whose exponent is within
+# this table is converted with a single rounding, the same as float().
+POW10 = np.array([float('1e%d' % i) for i in range(23)])
+MAX_EXACT_MANTISSA = 1 << 53
+
+
+@njit(cache=True)
+def _equals(buf, begin, end, value):
+    if end - begin != len(value):
+        return False
+    for i in range(len(value)):
+        if buf[begin + i] != value[i]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _to_int(buf, begin, end):
+    # Converts the field by int(), which raises ValueError for an empty or malformed field.
+    with objmode(v='int64'):
+        v = int(buf[begin:end].tobytes())
+    return v
+
+
+@njit(cache=True)
+def _to_float(buf, begin, end):
+    # Converts the field by float(), which raises ValueError for an empty or malformed field.
+    with objmode(v='float64'):
+        v = float(buf[begin:end].tobytes())
+    return v
+
+
+@njit(cache=True)
+def _parse_int(buf, begin, end):
+    i = begin
+    sign = 1
+    if i < end and buf[i] == ord('-'):
+        sign = -1
+        i += 1
+    elif i < end and buf[i] == ord('+'):
+        i += 1
+    if i == end or end - i > 18:
+        return _to_int(buf, begin, end)
+    v = 0
+    while i < end:
+        c = buf[i]
+        if c < ord('0') or c > ord('9'):
+            return _to_int(buf, begin, end)
+        v = v * 10 + (c - ord('0'))
+        i += 1
+    return sign * v
+
+
+@njit(cache=True)
+def _parse_float(buf, begin, end):
+    # Parses the digits into an integer mantissa and a decimal exponent. If the value can't be converted exactly this
+    # way, such as when it has too many significant digits, it falls back to float().
+    i = begin
+    sign = 1.0
+    if i < end and buf[i] == ord('-'):
+        sign = -1.0
+        i += 1
+    elif i < end and buf[i] == ord('+'):
+        i += 1
+    mantissa = 0
+    exp = 0
+    num_digits = 0
+    frac = False
+    while i < end:
+        c = buf[i]
+        if c == ord('.') and not frac:
+            frac = True
+        elif (c == ord('e') or c == ord('E')) and num_digits > 0:
+            exp += _parse_int(buf, i + 1, end)
+            break
+        elif ord('0') <= c <= ord('9') and mantissa < MAX_EXACT_MANTISSA:
+            mantissa = mantissa * 10 + (c - ord('0'))
+            num_digits += 1
+            if frac:
+                exp -= 1
+        else:
+            return _to_float(buf, begin, end)
+        i += 1
+    if num_digits == 0 or mantissa > MAX_EXACT_MANTISSA or exp >= len(POW10) or exp <= -len(POW10):
+        return _to_float(buf, begin, end)
+    elif exp >= 0:
+        return sign * mantissa * POW10[exp]
+    else:
+        return sign * mantissa / POW10[-exp]
+
+
+@njit(cache=True)
+def _warn_invalid_row(buf, begin, end):
+    with objmode():
+        print('Warning: Invalid Data Row', buf[begin:end].tobytes())
+
+
+@njit(cache=True)
+def _reserve(arr, size):
+    # Grows the buffer geometrically so that appending rows one by one takes amortized constant time.
+    if size <= len(arr):
+        return arr
+    new_arr = np.empty((max(size, int(len(arr) * 1.5)), arr.shape[1]), arr.dtype)
+    new_arr[:len(arr)] = arr
+    return new_arr
+
+
+@njit(nogil=True, cache=True)
+def _parse(buf, file_type, snapshot_mode, tmp, ss_bid, ss_ask, state):
+    # Parses the complete lines in the block, resuming from the state left by the previous block. Returns the buffers,
+    # which may have been grown, and the number of bytes consumed; an incomplete last line is left for the next block.
+    # The parser is compiled separately for each file type and snapshot mode, which are fixed for a file, so that the
+    # branches on them are resolved at compile time.
+    literally(file_type)
+    literally(snapshot_mode)
+    row_num = state[0]
+    is_snapshot = state[1] != 0
+    ss_bid_rn = state[2]
+    ss_ask_rn = state[3]
+    is_sod_snapshot = state[4] != 0
+    begins = np.empty(8, np.int64)
+    ends = np.empty(8, np.int64)
+
+    n = len(buf)
+
+    # Reserves the rows for the whole block at once instead of checking the buffer size for every row. Each line adds
+    # at most one row, except for the snapshot flush, which reserves the snapshot rows separately.
+    num_lines = 0
+    for i in range(n):
+        if buf[i] == NEWLINE:
+            num_lines += 1
+    tmp = _reserve(tmp, row_num + num_lines)
+
+    i = 0
+    while True:
+        # Splits the line into columns.
+        num_cols = 0
+        begins[0] = i
+        while i < n and buf[i] != NEWLINE:
+            if buf[i] == COMMA:
+                if num_cols < 8:
+                    ends[num_cols] = i
+                num_cols += 1
+                if num_cols < 8:
+                    begins[num_cols] = i + 1
+            i += 1
+        if i >= n:
+            break
+        line_end = i
+        if line_end > begins[0] and buf[line_end - 1] == ord('\r'):
+            line_end -= 1
+        if num_cols < 8:
+            ends[num_cols] = line_end
+        num_cols += 1
+        i += 1
+        if num_cols < 8:
+            if line_end > begins[0]:
+                _warn_invalid_row(buf, begins[0], line_end)
+            continue
+
+        if file_type == TRADE:
+            # Insert TRADE_EVENT
+            tmp[row_num, 0] = TRADE_EVENT
+            tmp[row_num, 1] = _parse_int(buf, begins[2], ends[2])
+            tmp[row_num, 2] = _parse_int(buf, begins[3], ends[3])
+            tmp[row_num, 3] = SIDE[buf[begins[5]]]
+            tmp[row_num, 4] = _parse_float(buf, begins[6], ends[6])
+            tmp[row_num, 5] = _parse_float(buf, begins[7], ends[7])
+            row_num += 1
+        elif file_type == DEPTH:
+            if _equals(buf, begins[4], ends[4], TRUE):
+                if (snapshot_mode == 2) or (snapshot_mode == 1 and is_sod_snapshot):
+                    continue
+                # Prepare to insert DEPTH_SNAPSHOT_EVENT
+                if not is_snapshot:
+                    # The snapshot buffers are reused across snapshots.
+                    is_snapshot = True
+                    ss_bid_rn = 0
+                    ss_ask_rn = 0
+                if SIDE[buf[begins[5]]] == 1:
+                    ss_bid = _reserve(ss_bid, ss_bid_rn + 1)
+                    ss_bid[ss_bid_rn, 0] = DEPTH_SNAPSHOT_EVENT
+                    ss_bid[ss_bid_rn, 1] = _parse_int(buf, begins[2], ends[2])
+                    ss_bid[ss_bid_rn, 2] = _parse_int(buf, begins[3], ends[3])
+                    ss_bid[ss_bid_rn, 3] = 1
+                    ss_bid[ss_bid_rn, 4] = _parse_float(buf, begins[6], ends[6])
+                    ss_bid[ss_bid_rn, 5] = _parse_float(buf, begins[7], ends[7])
+                    ss_bid_rn += 1
+                else:
+                    ss_ask = _reserve(ss_ask, ss_ask_rn + 1)
+                    ss_ask[ss_ask_rn, 0] = DEPTH_SNAPSHOT_EVENT
+                    ss_ask[ss_ask_rn, 1] = _parse_int(buf, begins[2], ends[2])
+                    ss_ask[ss_ask_rn, 2] = _parse_int(buf, begins[3], ends[3])
+                    ss_ask[ss_ask_rn, 3] = -1
+                    ss_ask[ss_ask_rn, 4] = _parse_float(buf, begins[6], ends[6])
+                    ss_ask[ss_ask_rn, 5] = _parse_float(buf, begins[7], ends[7])
+                    ss_ask_rn += 1
+            else:
+                is_sod_snapshot = False
+                if is_snapshot:
+                    # End of the snapshot.
+                    is_snapshot = False
+                    tmp = _reserve(tmp, row_num + ss_bid_rn + ss_ask_rn + 2 + num_lines)
+
+                    # Add DEPTH_CLEAR_EVENT before refreshing the market depth by the snapshot.
+                    if ss_bid_rn > 0:
+                        # Clear the bid market depth within the snapshot bid range.
+                        tmp[row_num, 0] = DEPTH_CLEAR_EVENT
+                        tmp[row_num, 1] = ss_bid[0, 1]
+                        tmp[row_num, 2] = ss_bid[0, 2]
+                        tmp[row_num, 3] = 1
+                        tmp[row_num, 4] = ss_bid[ss_bid_rn - 1, 4]
+                        tmp[row_num, 5] = 0
+                        row_num += 1
+                        # Add DEPTH_SNAPSHOT_EVENT for the bid snapshot
+                        tmp[row_num:row_num + ss_bid_rn] = ss_bid[:ss_bid_rn]
+                        row_num += ss_bid_rn
+
+                    if ss_ask_rn > 0:
+                        # Clear the ask market depth within the snapshot ask range.
+                        tmp[row_num, 0] = DEPTH_CLEAR_EVENT
+                        tmp[row_num, 1] = ss_ask[0, 1]
+                        tmp[row_num, 2] = ss_ask[0, 2]
+                        tmp[row_num, 3] = -1
+                        tmp[row_num, 4] = ss_ask[ss_ask_rn - 1, 4]
+                        tmp[row_num, 5] = 0
+                        row_num += 1
+                        # Add DEPTH_SNAPSHOT_EVENT for the ask snapshot
+                        tmp[row_num:row_num + ss_ask_rn] = ss_ask[:ss_ask_rn]
+                        row_num += ss_ask_rn
+                # Insert DEPTH_EVENT
+                tmp[row_num, 0] = DEPTH_EVENT
+                tmp[row_num, 1] = _parse_int(buf, begins[2], ends[2])
+                tmp[row_num, 2] = _parse_int(buf, begins[3], ends[3])
+                tmp[row_num, 3] = SIDE[buf[begins[5]]]
+                tmp[row_num, 4] = _parse_float(buf, begins[6], ends[6])
+                tmp[row_num, 5] = _parse_float(buf, begins[7], ends[7])
+                row_num += 1
+
+    state[0] = row_num
+    state[1] = is_snapshot
+    state[2] = ss_bid_rn
+    state[3] = ss_ask_rn
+    state[4] = is_sod_snapshot
+    return tmp, ss_bid, ss_ask, begins[0]
+
+
+@njit(nogil=True, cache=True)
+def _parse_block(buf, file_type, snapshot_mode, tmp, ss_bid, ss_ask, state):
+    # Calls the parser specialized for the given file type and snapshot mode. Calling the parser directly from Python
+    # would go through the failed non-literal dispatch and the recompilation lookup for every block, which takes far
+    # longer than parsing a block.
+    if file_type == TRADE:
+        return _parse(buf, TRADE, 0, tmp, ss_bid, ss_ask, state)
+    elif snapshot_mode == 0:
+        return _parse(buf, DEPTH, 0, tmp, ss_bid, ss_ask, state)
+    elif snapshot_mode == 1:
+        return _parse(buf, DEPTH, 1, tmp, ss_bid, ss_ask, state)
+    else:
+        return _parse(buf, DEPTH, 2, tmp, ss_bid, ss_ask, state)
+
+
+@njit(cache=True)
+def _is_sorted(data):
+    # Checks if the rows are sorted by local timestamp.
+    for i in range(1, len(data)):
+        if data[i, 2] < data[i - 1, 2]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _permute_rows(data, perm):
+    # Reorders the rows in place so that data[i] becomes the original data[perm[i]], by following the permutation
+    # cycles, instead of creating a reordered copy of the entire data.
+    visited = np.zeros(len(perm), np.bool_)
+    row = np.empty(data.shape[1], data.dtype)
+    for i in range(len(perm)):
+        if visited[i] or perm[i] == i:
+            continue
+        row[:] = data[i]
+        j = i
+        while True:
+            visited[j] = True
+            k = perm[j]
+            if k == i:
+                data[j] = row
+                break
+            data[j] = data[k]
+            j = k
+
+
+def _read_file(file, snapshot_mode, buffer_size, ss_buffer_size):
+    # Reads and parses a Tardis.dev data file. Returns None if the file format is not supported.
+    print('Reading %s' % file)
+    with gzip.open(file, 'rb') as f:
+        header = f.readline().decode().strip().split(',')
+        if header == [
+            'exchange',
+            'symbol',
+            'timestamp',
+            'local_timestamp',
+            'id',
+            'side',
+            'price',
+            'amount'
+        ]:
+            file_type = TRADE
+        elif header == [
+            'exchange',
+            'symbol',
+            'timestamp',
+            'local_timestamp',
+            'is_snapshot',
+            'side',
+            'price',
+            'amount'
+        ]:
+            file_type = DEPTH
+        else:
+            print('Warning: Unsupported file format', header)
+            return None
+
+        tmp = np.empty((buffer_size, 6), np.float64)
+        ss_bid = np.empty((ss_buffer_size, 6), np.float64)
+        ss_ask = np.empty((ss_buffer_size, 6), np.float64)
+        # row_num, is_snapshot, ss_bid_rn, ss_ask_rn, is_sod_snapshot
+        state = np.array([0, 0, 0, 0, 1], np.int64)
+        rest = b''
+        eof = False
+        while not eof:
+            block = f.read(READ_BLOCK_SIZE)
+            eof = len(block) == 0
+            if eof:
+                # Terminates the last line in case the file doesn't end with a newline.
+                block = b'\n'
+            buf = np.frombuffer(rest + block, np.uint8)
+            tmp, ss_bid, ss_ask, consumed = _parse_block(
+                buf,
+                file_type,
+                snapshot_mode,
+                tmp,
+                ss_bid,
+                ss_ask,
+                state
+            )
+            rest = buf[consumed:].tobytes()
+    return tmp[:state[0]]
 
-    Args:
-        input_files (List[str]): Input filenames for both incremental book and trades files.
-        output_filename (Optional[str], optional): If provided, the converted data will be saved to the specified filename in npz format. Defaults to None.
-        buffer_size (int, optional): Sets a preallocated row size for the buffer. Defaults to 100_000_000.
-        ss_buffer_size (int, optional): Sets a preallocated row size for the snapshot buffer. Defaults to 10_000.
-        base_latency (float, optional): The value to be added to the feed latency. Defaults to 0.
-        method (Literal['separate', 'adjust'], optional): The method to correct reversed exchange timestamp events. Defaults to 'separate'.
-        snapshot_mode (Literal['process', 'ignore_sod', 'ignore'], optional): The mode for processing snapshot events. Defaults to 'process'.
 
-    Returns:
-        NDArray: Converted data compatible with HftBacktest.
-    """
-    # Function code here
 def convert(
         input_files: List[str],
         output_filename: Optional[str] = None,
-        buffer_size: int = 100_000_000,
+        buffer_size: int = 1_000_000,
         ss_buffer_size: int = 10_000,
         base_latency: float = 0,
         method: Literal['separate', 'adjust'] = 'separate',
@@ -47,9 +395,15 @@ def convert(
 
     Args:
         input_files: Input filenames for both incremental book and trades files,
-                     e.g. ['incremental_book.csv', 'trades.csv'].
-        output_filename: If provided, the converted data will be saved to the specified filename in ``npz`` format.
-        buffer_size: Sets a preallocated row size for the buffer.
+                     e.g. ['incremental_book.csv', 'trades.csv']. The rows of the files are merged in local timestamp
+                     order. The rows that have the same local timestamp keep their order within a file and follow the
+                     order of the input files across the files. Files with an unsupported format are skipped.
+        output_filename: If provided, the converted data will be saved to the specified filename in ``npz`` format,
+                         or in ``npy`` format if the filename ends with ``.npy``. ``npy`` is written without the zip
+                         container and can be loaded lazily with ``np.load(output_filename, mmap_mode='r')``.
+        buffer_size: Sets an initial row size for the buffer. The buffer grows as needed.
+        ss_buffer_size: Sets an initial row size for the snapshot buffers. The buffers are reused across snapshots and
+                        grow as needed.
         base_latency: The value to be added to the feed latency.
                       See :func:`.correct_local_timestamp`.
         method: The method to correct reversed exchange timestamp events. See :func:`..validation.correct`.
@@ -65,155 +419,26 @@ def convert(
     Returns:
         Converted data compatible with HftBacktest.
     """
-    TRADE = 0
-    DEPTH = 1
-
-    sets = []
-    for file in input_files:
-        file_type = None
-        tmp = np.empty((buffer_size, 6), np.float64)
-        row_num = 0
-        is_snapshot = False
-        ss_bid = None
-        ss_ask = None
-        ss_bid_rn = 0
-        ss_ask_rn = 0
-        is_sod_snapshot = True
-        print('Reading %s' % file)
-        with gzip.open(file, 'r') as f:
-            while True:
-                line = f.readline()
-                if line is None or line == b'':
-                    break
-                cols = line.decode().strip().split(',')
-                if len(cols) < 8:
-                    print('Warning: Invalid Data Row', cols, line)
-                    continue
-                if file_type is None:
-                    if cols == [
-                        'exchange',
-                        'symbol',
-                        'timestamp',
-                        'local_timestamp',
-                        'id',
-                        'side',
-                        'price',
-                        'amount'
-                    ]:
-                        file_type = TRADE
-                    elif cols == [
-                        'exchange',
-                        'symbol',
-                        'timestamp',
-                        'local_timestamp',
-                        'is_snapshot',
-                        'side',
-                        'price',
-                        'amount'
-                    ]:
-                        file_type = DEPTH
-                elif file_type == TRADE:
-                    # Insert TRADE_EVENT
-                    tmp[row_num] = [
-                        TRADE_EVENT,
-                        int(cols[2]),
-                        int(cols[3]),
-                        1 if cols[5] == 'buy' else -1,
-                        float(cols[6]),
-                        float(cols[7])
-                    ]
-                    row_num += 1
-                elif file_type == DEPTH:
-                    if cols[4] == 'true':
-                        if (snapshot_mode == 'ignore') or (snapshot_mode == 'ignore_sod' and is_sod_snapshot):
-                            continue
-                        # Prepare to insert DEPTH_SNAPSHOT_EVENT
-                        if not is_snapshot:
-                            is_snapshot = True
-                            ss_bid = np.empty((ss_buffer_size, 6), np.float64)
-                            ss_ask = np.empty((ss_buffer_size, 6), np.float64)
-                            ss_bid_rn = 0
-                            ss_ask_rn = 0
-                        if cols[5] == 'bid':
-                            ss_bid[ss_bid_rn] = [
-                                DEPTH_SNAPSHOT_EVENT,
-                                int(cols[2]),
-                                int(cols[3]),
-                                1,
-                                float(cols[6]),
-                                float(cols[7])
-                            ]
-                            ss_bid_rn += 1
-                        else:
-                            ss_ask[ss_ask_rn] = [
-                                DEPTH_SNAPSHOT_EVENT,
-                                int(cols[2]),
-                                int(cols[3]),
-                                -1,
-                                float(cols[6]),
-                                float(cols[7])
-                            ]
-                            ss_ask_rn += 1
-                    else:
-                        is_sod_snapshot = False
-                        if is_snapshot:
-                            # End of the snapshot.
-                            is_snapshot = False
-
-                            # Add DEPTH_CLEAR_EVENT before refreshing the market depth by the snapshot.
-                            ss_bid = ss_bid[:ss_bid_rn]
-                            if len(ss_bid) > 0:
-                                # Clear the bid market depth within the snapshot bid range.
-                                tmp[row_num] = [
-                                    DEPTH_CLEAR_EVENT,
-                                    ss_bid[0, 1],
-                                    ss_bid[0, 2],
-                                    1,
-                                    ss_bid[-1, 4],
-                                    0
-                                ]
-                                row_num += 1
-                                # Add DEPTH_SNAPSHOT_EVENT for the bid snapshot
-                                tmp[row_num:row_num + len(ss_bid)] = ss_bid[:]
-                                row_num += len(ss_bid)
-                            ss_bid = None
-
-                            ss_ask = ss_ask[:ss_ask_rn]
-                            if len(ss_ask) > 0:
-                                # Clear the ask market depth within the snapshot ask range.
-                                tmp[row_num] = [
-                                    DEPTH_CLEAR_EVENT,
-                                    ss_ask[0, 1],
-                                    ss_ask[0, 2],
-                                    -1,
-                                    ss_ask[-1, 4],
-                                    0
-                                ]
-                                row_num += 1
-                                # Add DEPTH_SNAPSHOT_EVENT for the ask snapshot
-                                tmp[row_num:row_num + len(ss_ask)] = ss_ask[:]
-                                row_num += len(ss_ask)
-                            ss_ask = None
-                        # Insert DEPTH_EVENT
-                        tmp[row_num] = [
-                            DEPTH_EVENT,
-                            int(cols[2]),
-                            int(cols[3]),
-                            1 if cols[5] == 'bid' else -1,
-                            float(cols[6]),
-                            float(cols[7])
-                        ]
-                        row_num += 1
-        sets.append(tmp[:row_num])
+    # Both gzip decompression and the parser release the GIL, so the files are read concurrently.
+    with ThreadPoolExecutor() as executor:
+        sets = list(executor.map(
+            lambda file: _read_file(file, SNAPSHOT_MODES[snapshot_mode], buffer_size, ss_buffer_size),
+            input_files
+        ))
+    sets = [data for data in sets if data is not None]
+    if len(sets) == 0:
+        sets.append(np.empty((0, 6), np.float64))
 
     print('Merging')
-    data = sets[0]
-    del sets[0]
-    while len(sets) > 0:
-        data = merge_on_local_timestamp(data, sets[0])
-        del sets[0]
+    data = np.concatenate(sets)
+    sets.clear()
 
-    data = data[np.argsort(data[:, 2])]
+    # Sorts all rows at once by local timestamp. The sort is stable, so the rows that have the same local timestamp
+    # keep their order within a file, and are ordered by the input file order across the files. The reversed exchange
+    # timestamps among them are left to be corrected. The sort is skipped if the rows are already sorted, which is
+    # often the case with a single input file.
+    if not _is_sorted(data):
+        _permute_rows(data, np.argsort(data[:, 2], kind='stable'))
     data = correct(data, base_latency=base_latency, method=method)
 
     # Validate again.
@@ -223,6 +448,9 @@ def convert(
 
     if output_filename is not None:
         print('Saving to %s' % output_filename)
-        np.savez(output_filename, data=data)
+        if output_filename.endswith('.npy'):
+            np.save(output_filename, data)
+        else:
+            np.savez(output_filename, data=data)
 
     return data
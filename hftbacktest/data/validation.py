@@ -23,7 +23,7 @@ from ..reader import (
 Data = Union[NDArray, DataFrame]
 
 
-@njit
+@njit(cache=True)
 def _validate_data(
         data,
         tick_size=None,
@@ -134,7 +134,7 @@ def validate_data(
     return num_reversed_exch_timestamp
 
 
-@njit
+@njit(cache=True)
 def _correct_local_timestamp(data, base_latency):
     latency = sys.maxsize
     for row_num in range(len(data)):
@@ -183,7 +183,7 @@ def correct_local_timestamp(data: Data, base_latency: float) -> Data:
         raise ValueError('Unsupported data type')
 
 
-@njit
+@njit(cache=True)
 def _correct_exch_timestamp(data, num_corr):
     row_size, col_size = data.shape
     corr = np.zeros((row_size + num_corr, col_size), np.float64)
@@ -245,7 +245,7 @@ def correct_exch_timestamp(data: Data, num_corr: int) -> Data:
         raise ValueError('Unsupported data type')
 
 
-@njit
+@njit(cache=True)
 def _correct_exch_timestamp_adjust(data):
     # Sort by exch_timestamp
     i = np.argsort(data[:, COL_EXCH_TIMESTAMP])
@@ -12,7 +12,7 @@ INVALID_MIN = -sys.maxsize
 INVALID_MAX = sys.maxsize
 
 
-@njit
+@njit(cache=True)
 def depth_below(depth, start, end):
     for t in range(start - 1, end - 1, -1):
         if t in depth and depth[t] > 0:
@@ -20,7 +20,7 @@ def depth_below(depth, start, end):
     return INVALID_MIN
 
 
-@njit
+@njit(cache=True)
 def depth_above(depth, start, end):
     for t in range(start + 1, end + 1):
         if t in depth and depth[t] > 0:
@@ -1,8 +1,8 @@
 import numpy as np
-from numba import float64, int64, int8, boolean
+from numba import float64, int64, int8, boolean, from_dtype, njit
 from numba.experimental import jitclass
-from numba.typed import Dict, List
-from numba.types import DictType, ListType, Tuple
+from numba.typed import Dict
+from numba.types import DictType
 
 
 BUY = 1
@@ -117,7 +117,83 @@ class Order:
 
 order_ty = Order.class_type.instance_type
 order_ladder_ty = DictType(int64, order_ty)
-order_tup_ty = Tuple((order_ty, int64))
+
+# A flat record of Order that is used to pass orders through OrderBus without allocating Order instances. The 8-byte
+# fields come first so that the record has no padding between fields.
+order_dtype = np.dtype(
+    [
+        ('qty', 'f8'),
+        ('leaves_qty', 'f8'),
+        ('price_tick', 'i8'),
+        ('tick_size', 'f8'),
+        ('exch_timestamp', 'i8'),
+        ('local_timestamp', 'i8'),
+        ('exec_price_tick', 'i8'),
+        ('exec_qty', 'f8'),
+        ('order_id', 'i8'),
+        ('q0', 'f8'),
+        ('q1', 'f8'),
+        ('side', 'i1'),
+        ('time_in_force', 'i1'),
+        ('status', 'i1'),
+        ('req', 'i1'),
+        ('maker', '?'),
+        ('order_type', 'i1'),
+    ],
+    align=True
+)
+order_rec_ty = from_dtype(order_dtype)
+
+
+@njit
+def write_order(rec, order):
+    """
+    Writes the given order into the order record.
+    """
+    rec.qty = order.qty
+    rec.leaves_qty = order.leaves_qty
+    rec.price_tick = order.price_tick
+    rec.tick_size = order.tick_size
+    rec.side = order.side
+    rec.time_in_force = order.time_in_force
+    rec.exch_timestamp = order.exch_timestamp
+    rec.status = order.status
+    rec.local_timestamp = order.local_timestamp
+    rec.req = order.req
+    rec.exec_price_tick = order.exec_price_tick
+    rec.exec_qty = order.exec_qty
+    rec.order_id = order.order_id
+    rec.q0 = order.q[0]
+    rec.q1 = order.q[1]
+    rec.maker = order.maker
+    rec.order_type = order.order_type
+
+
+@njit
+def read_order(rec):
+    """
+    Creates an order from the order record.
+    """
+    order = Order(
+        rec.order_id,
+        rec.price_tick,
+        rec.tick_size,
+        rec.qty,
+        rec.side,
+        rec.time_in_force,
+        rec.order_type
+    )
+    order.leaves_qty = rec.leaves_qty
+    order.exch_timestamp = rec.exch_timestamp
+    order.status = rec.status
+    order.local_timestamp = rec.local_timestamp
+    order.req = rec.req
+    order.exec_price_tick = rec.exec_price_tick
+    order.exec_qty = rec.exec_qty
+    order.q[0] = rec.q0
+    order.q[1] = rec.q1
+    order.maker = rec.maker
+    return order
 
 
 @jitclass
@@ -125,9 +201,20 @@ class OrderBus:
     """
     OrderBus class represents a bus for managing orders in a high-frequency trading backtesting system.
 
+    Orders are stored as ``order_dtype`` records, so appending an order takes a snapshot of it and the sender doesn't
+    need to copy the order beforehand. The records form a ring buffer, as orders are appended at the tail and
+    processed from the head.
+
     Attributes:
-        order_list (ListType): A list of order tuples.
+        order_list (ndarray): A ring buffer of order records.
+        timestamps (ndarray): A ring buffer of the receive timestamps of the order records.
+        head (int64): The position of the first order record in the ring buffer.
+        size (int64): The number of the order records.
         orders (DictType): A dictionary of order IDs and their counts.
+        recv_timestamps (DictType): A dictionary of order IDs and the receive timestamps of their frontmost order
+                                    records.
+
+    Properties:
         frontmost_timestamp (int64): The frontmost timestamp of the order list.
 
     Methods:
@@ -140,9 +227,12 @@ class OrderBus:
         delitem: Deletes an order tuple by its index.
         __contains__: Checks if an order ID exists in the order dictionary.
     """
-    order_list: ListType(order_tup_ty)
+    order_list: order_rec_ty[:]
+    timestamps: int64[:]
+    head: int64
+    size: int64
     orders: DictType(int64, int64)
-    frontmost_timestamp: int64
+    recv_timestamps: DictType(int64, int64)
 
     def __init__(self):
         """
@@ -154,9 +244,12 @@ class OrderBus:
         Returns:
             None
         """
-        self.order_list = List.empty_list(order_tup_ty)
+        self.order_list = np.empty(64, order_dtype)
+        self.timestamps = np.empty(64, np.int64)
+        self.head = 0
+        self.size = 0
         self.orders = Dict.empty(int64, int64)
-        self.frontmost_timestamp = 0
+        self.recv_timestamps = Dict.empty(int64, int64)
 
     def append(self, order, timestamp):
         """
@@ -167,26 +260,51 @@ class OrderBus:
             timestamp (int): The timestamp of the order.
 
         Returns:
-            None
+            record: The order record written. Within Numba JIT'ed code, it is a view into the bus, so the sender can
+                    alter the request on it before the next append.
         """
         timestamp = int(timestamp)
 
-        if len(self.order_list) > 0:
-            _, latest_timestamp = self.order_list[-1]
+        if self.size > 0:
+            latest_timestamp = self.timestamps[self._index(self.size - 1)]
             if timestamp < latest_timestamp:
                 timestamp = latest_timestamp
 
-        self.order_list.append((order, timestamp))
+        if self.size == len(self.order_list):
+            # Unrolls the ring buffer into a larger one.
+            order_list = np.empty(2 * len(self.order_list), order_dtype)
+            timestamps = np.empty(2 * len(self.timestamps), np.int64)
+            for i in range(self.size):
+                order_list[i] = self.order_list[self._index(i)]
+                timestamps[i] = self.timestamps[self._index(i)]
+            self.order_list = order_list
+            self.timestamps = timestamps
+            self.head = 0
+
+        i = self._index(self.size)
+        write_order(self.order_list[i], order)
+        self.timestamps[i] = timestamp
+        self.size += 1
 
         if order.order_id in self.orders:
             self.orders[order.order_id] += 1
         else:
             self.orders[order.order_id] = 1
+            self.recv_timestamps[order.order_id] = timestamp
+        return self.order_list[i]
 
-        if self.frontmost_timestamp <= 0:
-            self.frontmost_timestamp = timestamp
-        else:
-            self.frontmost_timestamp = min(self.frontmost_timestamp, timestamp)
+    @property
+    def frontmost_timestamp(self):
+        """
+        Returns the frontmost timestamp of the order list. Since the append method enforces the receive timestamps to
+        be sequential, it is the receive timestamp of the first order record.
+
+        Returns:
+            int: The frontmost timestamp, or 0 if the order list is empty.
+        """
+        if self.size > 0:
+            return self.timestamps[self.head]
+        return 0
 
     def get(self, order_id):
         """
@@ -201,10 +319,7 @@ class OrderBus:
         Raises:
             KeyError: If the order ID does not exist in the order list.
         """
-        for order, recv_timestamp in self.order_list:
-            if order.order_id == order_id:
-                return recv_timestamp
-        raise KeyError
+        return self.recv_timestamps[order_id]
 
     def reset(self):
         """
@@ -216,9 +331,10 @@ class OrderBus:
         Returns:
             None
         """
-        self.order_list.clear()
+        self.head = 0
+        self.size = 0
         self.orders.clear()
-        self.frontmost_timestamp = 0
+        self.recv_timestamps.clear()
 
     def __getitem__(self, key):
         """
@@ -233,7 +349,10 @@ class OrderBus:
         Raises:
             IndexError: If the index is out of range.
         """
-        return self.order_list[key]
+        if key < 0 or key >= self.size:
+            raise IndexError
+        i = self._index(key)
+        return read_order(self.order_list[i]), self.timestamps[i]
 
     def __len__(self):
         """
@@ -245,7 +364,7 @@ class OrderBus:
         Returns:
             int: The length of the order list.
         """
-        return len(self.order_list)
+        return self.size
 
     def delitem(self, key):
         """
@@ -260,11 +379,40 @@ class OrderBus:
         Raises:
             IndexError: If the index is out of range.
         """
-        order, _ = self.order_list[key]
-        del self.order_list[key]
-        self.orders[order.order_id] -= 1
-        if self.orders[order.order_id] <= 0:
-            del self.orders[order.order_id]
+        if key < 0 or key >= self.size:
+            raise IndexError
+        order_id = self.order_list[self._index(key)].order_id
+        if key == 0:
+            # Deleting the first order record only advances the head.
+            self.head = self._index(1)
+        else:
+            for k in range(key, self.size - 1):
+                self.order_list[self._index(k)] = self.order_list[self._index(k + 1)]
+                self.timestamps[self._index(k)] = self.timestamps[self._index(k + 1)]
+        self.size -= 1
+        self.orders[order_id] -= 1
+        if self.orders[order_id] <= 0:
+            del self.orders[order_id]
+            del self.recv_timestamps[order_id]
+        else:
+            # Finds the receive timestamp of the next order record with the same order ID.
+            for k in range(self.size):
+                i = self._index(k)
+                if self.order_list[i].order_id == order_id:
+                    self.recv_timestamps[order_id] = self.timestamps[i]
+                    break
+
+    def _index(self, key):
+        """
+        Returns the position of the order record in the ring buffer by its index.
+
+        Parameters:
+            key (int): The index of the order record.
+
+        Returns:
+            int: The position in the ring buffer.
+        """
+        return (self.head + key) % len(self.order_list)
 
     def __contains__(self, key):
         """
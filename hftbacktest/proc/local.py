@@ -175,15 +175,15 @@ class Local_(Proc):
 
         self.orders[order.order_id] = order
 
-        order = order.copy()
-
+        # OrderBus takes a snapshot of the order, so the order doesn't need to be copied, and the request is altered on
+        # the appended order record without affecting the local order.
         lat = self.order_latency.entry(current_timestamp, order, self)
         # Negative latency indicates that the order is rejected for technical reasons, and its value represents the
         # latency that the local experiences when receiving the rejection notification
         if lat < 0:
             # Rejects the order.
-            order.status = REJECTED
-            self.orders_from.append(order, current_timestamp - lat)
+            rec = self.orders_from.append(order, current_timestamp - lat)
+            rec.status = REJECTED
             return
 
         exch_recv_timestamp = current_timestamp + lat
@@ -200,23 +200,20 @@ class Local_(Proc):
 
         order.req = MODIFY
 
-        order = order.copy()
-
         lat = self.order_latency.entry(current_timestamp, order, self)
         # Negative latency indicates that the order is rejected for technical reasons, and its value represents the
         # latency that the local experiences when receiving the rejection notification
         if lat < 0:
             # Rejects the order.
-            order.req = REJECTED
-            self.orders_from.append(order, current_timestamp - lat)
+            rec = self.orders_from.append(order, current_timestamp - lat)
+            rec.req = REJECTED
             return
 
-        order.price_tick = round(price / self.depth.tick_size)
-        order.qty = qty
-
         exch_recv_timestamp = current_timestamp + lat
 
-        self.orders_to.append(order, exch_recv_timestamp)
+        rec = self.orders_to.append(order, exch_recv_timestamp)
+        rec.price_tick = round(price / self.depth.tick_size)
+        rec.qty = qty
 
     def cancel(self, order_id, current_timestamp):
         order = self.orders.get(order_id)
@@ -228,15 +225,13 @@ class Local_(Proc):
 
         order.req = CANCELED
 
-        order = order.copy()
-
         lat = self.order_latency.entry(current_timestamp, order, self)
         # Negative latency indicates that the order is rejected for technical reasons, and its value represents the
         # latency that the local experiences when receiving the rejection notification
         if lat < 0:
             # Rejects the order.
-            order.req = REJECTED
-            self.orders_from.append(order, current_timestamp - lat)
+            rec = self.orders_from.append(order, current_timestamp - lat)
+            rec.req = REJECTED
             return
 
         exch_recv_timestamp = current_timestamp + lat
@@ -206,8 +206,9 @@ class NoPartialFillExchange_(Proc):
                             )
                 else:
                     for t in range(self.depth.best_bid_tick + 1, price_tick + 1):
-                        if t in self.sell_orders:
-                            for order in list(self.sell_orders[t].values()):
+                        o = self.sell_orders.get(t)
+                        if o is not None:
+                            for order in list(o.values()):
                                 self.__check_if_sell_filled(
                                     order,
                                     price_tick,
@@ -227,8 +228,9 @@ class NoPartialFillExchange_(Proc):
                             )
                 else:
                     for t in range(self.depth.best_ask_tick - 1, price_tick - 1, -1):
-                        if t in self.buy_orders:
-                            for order in list(self.buy_orders[t].values()):
+                        o = self.buy_orders.get(t)
+                        if o is not None:
+                            for order in list(o.values()):
                                 self.__check_if_buy_filled(
                                     order,
                                     price_tick,
@@ -310,8 +312,9 @@ class NoPartialFillExchange_(Proc):
         Returns:
             None
         """
-        if price_tick in self.buy_orders:
-            for order in self.buy_orders[price_tick].values():
+        o = self.buy_orders.get(price_tick)
+        if o is not None:
+            for order in o.values():
                 self.queue_model.depth(order, prev_qty, new_qty, self)
 
     def on_ask_qty_chg(
@@ -333,8 +336,9 @@ class NoPartialFillExchange_(Proc):
         Returns:
             None
         """
-        if price_tick in self.sell_orders:
-            for order in self.sell_orders[price_tick].values():
+        o = self.sell_orders.get(price_tick)
+        if o is not None:
+            for order in o.values():
                 self.queue_model.depth(order, prev_qty, new_qty, self)
 
     def on_best_bid_update(self, prev_best, new_best, timestamp):
@@ -358,8 +362,9 @@ class NoPartialFillExchange_(Proc):
                     self.__fill(order, timestamp, True)
         else:
             for t in range(prev_best + 1, new_best + 1):
-                if t in self.sell_orders:
-                    for order in list(self.sell_orders[t].values()):
+                o = self.sell_orders.get(t)
+                if o is not None:
+                    for order in list(o.values()):
                         self.__fill(order, timestamp, True)
 
     def on_best_ask_update(self, prev_best, new_best, timestamp):
@@ -383,8 +388,9 @@ class NoPartialFillExchange_(Proc):
                     self.__fill(order, timestamp, True)
         else:
             for t in range(new_best, prev_best):
-                if t in self.buy_orders:
-                    for order in list(self.buy_orders[t].values()):
+                o = self.buy_orders.get(t)
+                if o is not None:
+                    for order in list(o.values()):
                         self.__fill(order, timestamp, True)
 
     def __ack_new(self, order, timestamp):
@@ -453,7 +459,7 @@ class NoPartialFillExchange_(Proc):
                 order.status = NEW
         order.exch_timestamp = timestamp
         local_recv_timestamp = timestamp + self.order_latency.response(timestamp, order, self)
-        self.orders_to.append(order.copy(), local_recv_timestamp)
+        self.orders_to.append(order, local_recv_timestamp)
         return local_recv_timestamp
 
     def __ack_modify(self, order, timestamp):
@@ -465,7 +471,7 @@ class NoPartialFillExchange_(Proc):
             order.exch_timestamp = timestamp
             local_recv_timestamp = timestamp + self.order_latency.response(timestamp, order, self)
             # It can overwrite another existing order on the local side if order_id is the same. So, commented out.
-            # self.orders_to.append(order.copy(), local_recv_timestamp)
+            # self.orders_to.append(order, local_recv_timestamp)
             return local_recv_timestamp
 
         prev_price_tick = exch_order.price_tick
@@ -539,7 +545,7 @@ class NoPartialFillExchange_(Proc):
                 exch_order.status = NEW
         exch_order.exch_timestamp = timestamp
         local_recv_timestamp = timestamp + self.order_latency.response(timestamp, exch_order, self)
-        self.orders_to.append(exch_order.copy(), local_recv_timestamp)
+        self.orders_to.append(exch_order, local_recv_timestamp)
         return local_recv_timestamp
 
     def __ack_cancel(self, order, timestamp):
@@ -551,7 +557,7 @@ class NoPartialFillExchange_(Proc):
             order.exch_timestamp = timestamp
             local_recv_timestamp = timestamp + self.order_latency.response(timestamp, order, self)
             # It can overwrite another existing order on the local side if order_id is the same. So, commented out.
-            # self.orders_to.append(order.copy(), local_recv_timestamp)
+            # self.orders_to.append(order, local_recv_timestamp)
             return local_recv_timestamp
 
         # Delete the order.
@@ -565,7 +571,7 @@ class NoPartialFillExchange_(Proc):
         exch_order.status = CANCELED
         exch_order.exch_timestamp = timestamp
         local_recv_timestamp = timestamp + self.order_latency.response(timestamp, exch_order, self)
-        self.orders_to.append(exch_order.copy(), local_recv_timestamp)
+        self.orders_to.append(exch_order, local_recv_timestamp)
         return local_recv_timestamp
 
     def __fill(
@@ -598,7 +604,7 @@ class NoPartialFillExchange_(Proc):
                 del self.sell_orders[order.price_tick][order.order_id]
 
         self.state.apply_fill(order)
-        self.orders_to.append(order.copy(), local_recv_timestamp)
+        self.orders_to.append(order, local_recv_timestamp)
         return local_recv_timestamp
 
 
@@ -29,6 +29,7 @@ class Proc:
         next_timestamp: Returns the next valid timestamp.
         _next_data_timestamp_column: Finds the next valid timestamp in a specific column.
         process: Processes the data and orders.
+        process_batch: Processes the data and orders in a row until the other processor's turn.
     """
     def __init__(self):
         pass
@@ -180,24 +181,19 @@ class Proc:
                 or (next_data_timestamp <= 0 < next_recv_order_timestamp):
             # Processes the order part.
             next_timestamp = 0
-            next_frontmost_timestamp = 0
-            while self.orders_from.__len__() > 0:
+            # Since we enforce the order of received timestamps to be sequential in OrderBus's append method,
+            # all orders received at the frontmost timestamp are at the front of the order bus.
+            while self.orders_from.__len__() > 0 \
+                    and self.orders_from.frontmost_timestamp <= next_recv_order_timestamp:
                 order, recv_timestamp = self.orders_from[0]
-                if recv_timestamp <= self.orders_from.frontmost_timestamp:
-                    self.orders_from.delitem(0)
-
-                    next_timestamp = self._process_recv_order(
-                        order,
-                        recv_timestamp,
-                        wait_resp,
-                        next_timestamp
-                    )
-                else:
-                    # Since we enforce the order of received timestamps to be sequential in OrderBus's append method,
-                    # the next received timestamp is the next frontmost timestamp.
-                    next_frontmost_timestamp = recv_timestamp
-                    break
-            self.orders_from.frontmost_timestamp = next_frontmost_timestamp
+                self.orders_from.delitem(0)
+
+                next_timestamp = self._process_recv_order(
+                    order,
+                    recv_timestamp,
+                    wait_resp,
+                    next_timestamp
+                )
             return next_timestamp
         else:
             # Processes the data part.
@@ -211,6 +207,31 @@ class Proc:
 
             return self._process_data(row)
 
+    def process_batch(self, wait_resp, timestamp, other_timestamp):
+        """
+        Processes the data and orders in a row as long as the next timestamp precedes the other processor's next
+        timestamp and doesn't exceed the given timestamp. The caller must have checked that the first event meets these
+        conditions, and processing this processor must not change the other processor's next timestamp.
+
+        Args:
+            wait_resp: The order ID to wait for a response.
+            timestamp: The timestamp up to which the events are processed.
+            other_timestamp: The other processor's next timestamp.
+
+        Returns:
+            The timestamp of the response, if found, otherwise 0.
+        """
+        while True:
+            resp_timestamp = self.process(wait_resp)
+            if resp_timestamp > 0:
+                return resp_timestamp
+
+            next_timestamp = self.next_timestamp()
+            if next_timestamp > timestamp:
+                return 0
+            if not ((0 < next_timestamp < other_timestamp) or (next_timestamp > 0 >= other_timestamp)):
+                return 0
+
     @property
     def tick_size(self):
         """
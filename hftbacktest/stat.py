@@ -3,7 +3,7 @@ from typing import Literal, Optional
 from numba.experimental import jitclass
 from numba.typed import List
 from numba.types import ListType
-from numba import float64, int64
+from numba import float64, int64, njit
 from matplotlib import pyplot as plt
 import pandas as pd
 import numpy as np
@@ -11,6 +11,24 @@ import numpy as np
 from .typing import HftBacktestType
 
 
+@njit(cache=True)
+def to_ndarray(values):
+    """
+    Copies a typed list into a new array. This is much faster than ``np.asarray``, which iterates over the typed list
+    through Python.
+
+    Args:
+        values: The typed list to be copied.
+
+    Returns:
+        The array of the values.
+    """
+    arr = np.empty(len(values), values._dtype)
+    for i in range(len(values)):
+        arr[i] = values[i]
+    return arr
+
+
 class Recorder:
     timestamp: ListType(int64)
     mid: ListType(float64)
@@ -101,7 +119,7 @@ class Stat:
         Returns:
             DateTime series by converting from the timestamp.
         """
-        return pd.to_datetime(np.asarray(self.timestamp), utc=self.utc, unit=self.unit)
+        return pd.to_datetime(to_ndarray(self.timestamp), utc=self.utc, unit=self.unit)
 
     def equity(self, resample: Optional[str] = None, include_fee: bool = True, datetime: bool = True):
         """
@@ -116,31 +134,32 @@ class Stat:
         Returns:
             the calculated equity values.
         """
-        if include_fee:
-            equity = pd.Series(
-                self.hbt.local.state.asset_type.equity(
-                    np.asarray(self.mid),
-                    np.asarray(self.balance),
-                    np.asarray(self.position),
-                    np.asarray(self.fee)
-                ),
-                index=self.datetime() if datetime else np.asarray(self.timestamp)
-            )
-        else:
-            equity = pd.Series(
-                self.hbt.local.state.asset_type.equity(
-                    np.asarray(self.mid),
-                    np.asarray(self.balance),
-                    np.asarray(self.position),
-                    0
-                ),
-                index=self.datetime() if datetime else np.asarray(self.timestamp)
-            )
+        equity = pd.Series(
+            self._equity(include_fee),
+            index=self.datetime() if datetime else to_ndarray(self.timestamp)
+        )
         if resample is None:
             return equity
         else:
             return equity.resample(resample).last()
 
+    def _equity(self, include_fee: bool):
+        """
+        Calculates the equity values of all recorded points at once.
+
+        Args:
+            include_fee: If set to ``True``, fees will be included in the calculation; otherwise, fees will be excluded.
+
+        Returns:
+            The array of the equity values.
+        """
+        return self.hbt.local.state.asset_type.equity(
+            to_ndarray(self.mid),
+            to_ndarray(self.balance),
+            to_ndarray(self.position),
+            to_ndarray(self.fee) if include_fee else 0
+        )
+
     def sharpe(self, resample: str, include_fee: bool = True, trading_days: int = 365):
         """
         Calculates the Sharpe Ratio without considering benchmark rates.
@@ -226,7 +245,7 @@ class Stat:
         Returns:
             Average number of daily trades.
         """
-        return pd.Series(self.trade_num, index=self.datetime()).diff().rolling('1d').sum().mean()
+        return pd.Series(to_ndarray(self.trade_num), index=self.datetime()).diff().rolling('1d').sum().mean()
 
     def daily_trade_volume(self):
         """
@@ -235,7 +254,7 @@ class Stat:
         Returns:
             Average quantity of daily trades.
         """
-        return pd.Series(self.trade_qty, index=self.datetime()).diff().rolling('1d').sum().mean()
+        return pd.Series(to_ndarray(self.trade_qty), index=self.datetime()).diff().rolling('1d').sum().mean()
 
     def daily_trade_amount(self):
         """
@@ -244,7 +263,7 @@ class Stat:
         Returns:
             Average value of daily trades.
         """
-        return pd.Series(self.trade_amount, index=self.datetime()).diff().rolling('1d').sum().mean()
+        return pd.Series(to_ndarray(self.trade_amount), index=self.datetime()).diff().rolling('1d').sum().mean()
 
     def annualised_return(self, denom: Optional[float] = None, include_fee: bool = True, trading_days: int = 365):
         """
@@ -278,18 +297,8 @@ class Stat:
             trading_days: The number of trading days per year used for annualisation.
         """
         dt_index = self.datetime()
-        raw_equity = self.hbt.local.state.asset_type.equity(
-            np.asarray(self.mid),
-            np.asarray(self.balance),
-            np.asarray(self.position),
-            np.asarray(self.fee)
-        )
-        raw_equity_wo_fee = self.hbt.local.state.asset_type.equity(
-            np.asarray(self.mid),
-            np.asarray(self.balance),
-            np.asarray(self.position),
-            0
-        )
+        raw_equity = self._equity(True)
+        raw_equity_wo_fee = self._equity(False)
         equity = pd.Series(raw_equity, index=dt_index)
         rs_equity_wo_fee = pd.Series(raw_equity_wo_fee, index=dt_index).resample(resample).last()
         rs_equity = equity.resample(resample).last()
@@ -309,9 +318,9 @@ class Stat:
         ar = raw_equity[-1] * ac * trading_days
         rrr = ar / mdd
 
-        dtn = pd.Series(self.trade_num, index=dt_index).diff().rolling('1d').sum().mean()
-        dtq = pd.Series(self.trade_qty, index=dt_index).diff().rolling('1d').sum().mean()
-        dta = pd.Series(self.trade_amount, index=dt_index).diff().rolling('1d').sum().mean()
+        dtn = pd.Series(to_ndarray(self.trade_num), index=dt_index).diff().rolling('1d').sum().mean()
+        dtq = pd.Series(to_ndarray(self.trade_qty), index=dt_index).diff().rolling('1d').sum().mean()
+        dta = pd.Series(to_ndarray(self.trade_amount), index=dt_index).diff().rolling('1d').sum().mean()
 
         print('=========== Summary ===========')
         print('Sharpe ratio: %.1f' % sr)
@@ -327,7 +336,7 @@ class Stat:
         print('Avg. daily trading volume: %d' % dtq)
         print('Avg. daily trading amount: %d' % dta)
 
-        position = np.asarray(self.position) * np.asarray(self.mid)
+        position = to_ndarray(self.position) * to_ndarray(self.mid)
         if capital is not None:
             print('Max leverage: %.2f' % (np.max(np.abs(position)) / capital))
             print('Median leverage: %.2f' % (np.median(np.abs(position)) / capital))
@@ -336,7 +345,7 @@ class Stat:
         fig.subplots_adjust(hspace=0)
         fig.set_size_inches(10, 6)
 
-        mid = pd.Series(self.mid, index=dt_index)
+        mid = pd.Series(to_ndarray(self.mid), index=dt_index)
 
         if capital is not None:
             ((mid / mid[0] - 1).resample(resample).last() * 100).plot(ax=axs[0], style='grey', alpha=0.5)
@@ -354,7 +363,7 @@ class Stat:
         axs[0].legend(['Trading asset', 'Strategy incl. fee', 'Strategy excl. fee'])
 
         # todo: this can mislead a user due to aggregation.
-        position = pd.Series(self.position, index=dt_index).resample(resample).last()
+        position = pd.Series(to_ndarray(self.position), index=dt_index).resample(resample).last()
         position.plot(ax=axs[1])
         # ax3 = ax2.twinx()
         # (position * mid).plot(ax=ax3, style='grey', alpha=0.2)
@@ -1,6 +1,41 @@
-from numba import typeof, float64, int64
+import numpy as np
+from numba import typeof, float64, int64, njit
 from numba.experimental import jitclass
 
+# The indices of the values in the state buffer.
+POSITION = 0
+BALANCE = 1
+FEE = 2
+TRADE_QTY = 3
+TRADE_AMOUNT = 4
+
+
+@njit
+def apply_fill_to_buf(buf, exec_price, exec_qty, side, maker, maker_fee, taker_fee, asset_type):
+    """
+    Applies a fill to the state buffer.
+
+    Args:
+        buf (ndarray): The state buffer.
+        exec_price (float): The executed price.
+        exec_qty (float): The executed quantity.
+        side (int): The side of the order.
+        maker (bool): Whether the order is filled as a maker.
+        maker_fee (float): The fee for maker orders.
+        taker_fee (float): The fee for taker orders.
+        asset_type (object): The asset type object.
+    """
+    # Selects the fee rate without a branch, as maker and taker fills arrive in no predictable order. For maker being 0
+    # or 1, this yields exactly either fee rate.
+    m = int64(maker)
+    fee = m * maker_fee + (1 - m) * taker_fee
+    amount = asset_type.amount(exec_price, exec_qty)
+    buf[POSITION] += exec_qty * side
+    buf[BALANCE] -= amount * side
+    buf[FEE] += amount * fee
+    buf[TRADE_QTY] += exec_qty
+    buf[TRADE_AMOUNT] += amount
+
 
 class State_:
     def __init__(
@@ -24,16 +59,125 @@ class State_:
             asset_type (object): The asset type object.
 
         """
-        self.position = start_position
-        self.balance = start_balance
-        self.fee = start_fee
+        self._buf = np.zeros(5, float64)
+        self._buf[POSITION] = start_position
+        self._buf[BALANCE] = start_balance
+        self._buf[FEE] = start_fee
         self.trade_num = 0
-        self.trade_qty = 0
-        self.trade_amount = 0
         self.maker_fee = maker_fee
         self.taker_fee = taker_fee
         self.asset_type = asset_type
 
+    @property
+    def position(self):
+        """
+        Get the current position.
+
+        Returns:
+            float: The position.
+
+        """
+        return self._buf[POSITION]
+
+    @position.setter
+    def position(self, value):
+        """
+        Set the position.
+
+        Args:
+            value (float): The position.
+
+        """
+        self._buf[POSITION] = value
+
+    @property
+    def balance(self):
+        """
+        Get the current balance.
+
+        Returns:
+            float: The balance.
+
+        """
+        return self._buf[BALANCE]
+
+    @balance.setter
+    def balance(self, value):
+        """
+        Set the balance.
+
+        Args:
+            value (float): The balance.
+
+        """
+        self._buf[BALANCE] = value
+
+    @property
+    def fee(self):
+        """
+        Get the accumulated fee.
+
+        Returns:
+            float: The fee.
+
+        """
+        return self._buf[FEE]
+
+    @fee.setter
+    def fee(self, value):
+        """
+        Set the fee.
+
+        Args:
+            value (float): The fee.
+
+        """
+        self._buf[FEE] = value
+
+    @property
+    def trade_qty(self):
+        """
+        Get the total traded quantity.
+
+        Returns:
+            float: The traded quantity.
+
+        """
+        return self._buf[TRADE_QTY]
+
+    @trade_qty.setter
+    def trade_qty(self, value):
+        """
+        Set the traded quantity.
+
+        Args:
+            value (float): The traded quantity.
+
+        """
+        self._buf[TRADE_QTY] = value
+
+    @property
+    def trade_amount(self):
+        """
+        Get the total traded amount.
+
+        Returns:
+            float: The traded amount.
+
+        """
+        return self._buf[TRADE_AMOUNT]
+
+    @trade_amount.setter
+    def trade_amount(self, value):
+        """
+        Set the traded amount.
+
+        Args:
+            value (float): The traded amount.
+
+        """
+        self._buf[TRADE_AMOUNT] = value
+
     def apply_fill(self, order):
         """
         Apply a fill to the state.
@@ -42,14 +186,17 @@ class State_:
             order (object): The order object.
 
         """
-        fee = self.maker_fee if order.maker else self.taker_fee
-        amount = self.asset_type.amount(order.exec_price, order.exec_qty)
-        self.position += (order.exec_qty * order.side)
-        self.balance -= (amount * order.side)
-        self.fee += (amount * fee)
+        apply_fill_to_buf(
+            self._buf,
+            order.exec_price,
+            order.exec_qty,
+            order.side,
+            order.maker,
+            self.maker_fee,
+            self.taker_fee,
+            self.asset_type
+        )
         self.trade_num += 1
-        self.trade_qty += order.exec_qty
-        self.trade_amount += amount
 
     def equity(self, mid):
         """
@@ -76,18 +223,22 @@ class State_:
             taker_fee (float): The fee for taker orders.
 
         """
-        self.position = start_position
-        self.balance = start_balance
-        self.fee = start_fee
+        self._buf[:] = 0
+        self._buf[POSITION] = start_position
+        self._buf[BALANCE] = start_balance
+        self._buf[FEE] = start_fee
         self.trade_num = 0
-        self.trade_qty = 0
-        self.trade_amount = 0
         if maker_fee is not None:
             self.maker_fee = maker_fee
         if taker_fee is not None:
             self.taker_fee = taker_fee
 
 
+# The jitted State_ classes by asset type. Every call of jitclass creates a distinct type, so the class is reused for the
+# same asset type to share its compiled methods among the states, such as the local's and the exchange's.
+_state_classes = {}
+
+
 def State(
         start_position,
         start_balance,
@@ -96,17 +247,19 @@ def State(
         taker_fee,
         asset_type
 ):
-    jitted = jitclass(spec=[
-        ('position', float64),
-        ('balance', float64),
-        ('fee', float64),
-        ('trade_num', int64),
-        ('trade_qty', float64),
-        ('trade_amount', float64),
-        ('maker_fee', float64),
-        ('taker_fee', float64),
-        ('asset_type', typeof(asset_type))
-    ])(State_)
+    asset_type_ty = typeof(asset_type)
+    jitted = _state_classes.get(asset_type_ty)
+    if jitted is None:
+        jitted = jitclass(spec=[
+            ('_buf', float64[::1]),
+            ('trade_num', int64),
+            ('maker_fee', float64),
+            ('taker_fee', float64),
+            # The state is specialized to the concrete asset type, so that amount and equity are bound at compile time
+            # and can be inlined without any runtime dispatch.
+            ('asset_type', asset_type_ty)
+        ])(State_)
+        _state_classes[asset_type_ty] = jitted
     return jitted(
         start_position,
         start_balance,
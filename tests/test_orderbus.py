@@ -0,0 +1,114 @@
+import unittest
+
+from numba import njit
+
+from hftbacktest.order import Order, OrderBus, BUY, GTC, LIMIT, NEW
+
+
+def new_order(order_id, price_tick=100):
+    return Order(order_id, price_tick, 0.1, 1.0, BUY, GTC, LIMIT)
+
+
+@njit
+def append_and_alter(bus, order, timestamp, qty):
+    # The appended record is a view into the bus only within Numba JIT'ed code.
+    rec = bus.append(order, timestamp)
+    rec.qty = qty
+
+
+class TestOrderBus(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bus = OrderBus()
+
+    def contents(self):
+        items = []
+        for i in range(len(self.bus)):
+            order, timestamp = self.bus[i]
+            items.append((order.order_id, timestamp))
+        return items
+
+    def test_append_snapshot(self):
+        order = new_order(1)
+        self.bus.append(order, 10)
+        order.price_tick = 200
+        order.status = NEW
+
+        received, timestamp = self.bus[0]
+        assert received.price_tick == 100
+        assert received.status != NEW
+        assert timestamp == 10
+
+        append_and_alter(self.bus, order, 20, 3.0)
+        assert self.bus[1][0].qty == 3.0
+        assert order.qty == 1.0
+
+    def test_sequential_timestamp(self):
+        self.bus.append(new_order(1), 10)
+        self.bus.append(new_order(2), 5)
+        assert self.contents() == [(1, 10), (2, 10)]
+        assert self.bus.frontmost_timestamp == 10
+
+    def test_grow_while_wrapped(self):
+        expected = []
+        for i in range(48):
+            self.bus.append(new_order(i), i + 1)
+            expected.append((i, i + 1))
+        for _ in range(40):
+            self.bus.delitem(0)
+            del expected[0]
+        # The records wrap around the end of the ring buffer and then it grows.
+        for i in range(48, 148):
+            self.bus.append(new_order(i), i + 1)
+            expected.append((i, i + 1))
+
+        assert len(self.bus) == len(expected)
+        assert self.contents() == expected
+        assert self.bus.frontmost_timestamp == expected[0][1]
+        for order_id, timestamp in expected:
+            assert order_id in self.bus
+            assert self.bus.get(order_id) == timestamp
+        assert 0 not in self.bus
+
+    def test_delitem(self):
+        for i in range(5):
+            self.bus.append(new_order(i), i + 1)
+        self.bus.delitem(2)
+        assert self.contents() == [(0, 1), (1, 2), (3, 4), (4, 5)]
+        assert 2 not in self.bus
+        self.bus.delitem(3)
+        assert self.contents() == [(0, 1), (1, 2), (3, 4)]
+        self.bus.delitem(0)
+        assert self.contents() == [(1, 2), (3, 4)]
+        assert self.bus.frontmost_timestamp == 2
+
+        with self.assertRaises(IndexError):
+            self.bus.delitem(2)
+        with self.assertRaises(IndexError):
+            self.bus[2]
+
+    def test_duplicated_order_id(self):
+        self.bus.append(new_order(1), 10)
+        self.bus.append(new_order(2), 20)
+        self.bus.append(new_order(1), 30)
+        assert self.bus.get(1) == 10
+
+        self.bus.delitem(0)
+        assert 1 in self.bus
+        assert self.bus.get(1) == 30
+
+        self.bus.delitem(1)
+        assert 1 not in self.bus
+        assert self.bus.get(2) == 20
+
+    def test_reset(self):
+        for i in range(70):
+            self.bus.append(new_order(i), i + 1)
+        self.bus.delitem(0)
+        self.bus.reset()
+        assert len(self.bus) == 0
+        assert self.bus.frontmost_timestamp == 0
+        assert 1 not in self.bus
+
+        self.bus.append(new_order(1), 5)
+        assert self.contents() == [(1, 5)]
+        assert self.bus.get(1) == 5
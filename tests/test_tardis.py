@@ -0,0 +1,153 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hftbacktest import DEPTH_CLEAR_EVENT, DEPTH_EVENT, DEPTH_SNAPSHOT_EVENT, TRADE_EVENT
+from hftbacktest.data.utils import tardis
+from hftbacktest.data.utils.tardis import _parse_float, _parse_int
+
+
+def parse_float(s):
+    buf = np.frombuffer(s.encode(), np.uint8)
+    return _parse_float(buf, 0, len(buf))
+
+
+def parse_int(s):
+    buf = np.frombuffer(s.encode(), np.uint8)
+    return _parse_int(buf, 0, len(buf))
+
+
+class TestTardis(unittest.TestCase):
+    def test_parse_float(self):
+        values = [
+            '0', '-0.0', '25000.5', '0.001', '.5', '5.', '+2.5', '1e5', '1.5E-3', '123e-30', '0.30000000000000004',
+            '9007199254740993', '0.1000000000000000000001', '12345678901234567890.5', 'inf'
+        ]
+        rng = np.random.default_rng(0)
+        for _ in range(10000):
+            digits = ''.join(rng.choice(list('0123456789'), rng.integers(1, 23)))
+            point = rng.integers(0, len(digits) + 1)
+            values.append(digits[:point] + '.' + digits[point:])
+        for value in values:
+            assert parse_float(value) == float(value), value
+            assert np.signbit(parse_float(value)) == np.signbit(float(value)), value
+
+        for value in ['', '-', 'abc', '1.2.3']:
+            with self.assertRaises(ValueError):
+                parse_float(value)
+
+    def test_parse_int(self):
+        for value in ['0', '-12', '+7', '1600000000000000000']:
+            assert parse_int(value) == int(value), value
+
+        for value in ['', '-', '1x']:
+            with self.assertRaises(ValueError):
+                parse_int(value)
+
+
+DEPTH_HEADER = b'exchange,symbol,timestamp,local_timestamp,is_snapshot,side,price,amount\n'
+DEPTH_LINES = [
+    b'binance-futures,BTCUSDT,1,2,true,bid,10.0,1\n',
+    b'binance-futures,BTCUSDT,1,2,true,bid,9.9,2\n',
+    b'binance-futures,BTCUSDT,1,2,true,ask,10.1,3\n',
+    b'binance-futures,BTCUSDT,3,4,false,bid,10.0,5\n',
+    b'binance-futures,BTCUSDT,5,6,true,ask,10.2,1\n',
+    b'binance-futures,BTCUSDT,5,6,true,bid,9.8,1\n',
+    b'binance-futures,BTCUSDT,7,8,false,ask,10.1,0\n',
+]
+
+TRADE_HEADER = b'exchange,symbol,timestamp,local_timestamp,id,side,price,amount\n'
+TRADE_LINES = [
+    b'binance-futures,BTCUSDT,1,3,100,buy,10.1,0.5\n',
+    b'binance-futures,BTCUSDT,2,4,101,sell,10.0,1.5\n',
+]
+
+SOD_SNAPSHOT = [
+    [DEPTH_CLEAR_EVENT, 1, 2, 1, 9.9, 0],
+    [DEPTH_SNAPSHOT_EVENT, 1, 2, 1, 10.0, 1],
+    [DEPTH_SNAPSHOT_EVENT, 1, 2, 1, 9.9, 2],
+    [DEPTH_CLEAR_EVENT, 1, 2, -1, 10.1, 0],
+    [DEPTH_SNAPSHOT_EVENT, 1, 2, -1, 10.1, 3],
+]
+SNAPSHOT = [
+    [DEPTH_CLEAR_EVENT, 5, 6, 1, 9.8, 0],
+    [DEPTH_SNAPSHOT_EVENT, 5, 6, 1, 9.8, 1],
+    [DEPTH_CLEAR_EVENT, 5, 6, -1, 10.2, 0],
+    [DEPTH_SNAPSHOT_EVENT, 5, 6, -1, 10.2, 1],
+]
+EXPECTED_DEPTH = {
+    'process': SOD_SNAPSHOT + [[DEPTH_EVENT, 3, 4, 1, 10.0, 5]] + SNAPSHOT + [[DEPTH_EVENT, 7, 8, -1, 10.1, 0]],
+    'ignore_sod': [[DEPTH_EVENT, 3, 4, 1, 10.0, 5]] + SNAPSHOT + [[DEPTH_EVENT, 7, 8, -1, 10.1, 0]],
+    'ignore': [[DEPTH_EVENT, 3, 4, 1, 10.0, 5], [DEPTH_EVENT, 7, 8, -1, 10.1, 0]],
+}
+EXPECTED_TRADE = [
+    [TRADE_EVENT, 1, 3, 1, 10.1, 0.5],
+    [TRADE_EVENT, 2, 4, -1, 10.0, 1.5],
+]
+
+
+class TestTardisReadFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.read_block_size = tardis.READ_BLOCK_SIZE
+
+    def tearDown(self) -> None:
+        tardis.READ_BLOCK_SIZE = self.read_block_size
+        self.dir.cleanup()
+
+    def write(self, name, content):
+        filename = os.path.join(self.dir.name, name)
+        with gzip.open(filename, 'wb') as f:
+            f.write(content)
+        return filename
+
+    def read(self, filename, snapshot_mode='process'):
+        # Starts with the smallest buffers so that they have to grow.
+        return tardis._read_file(filename, tardis.SNAPSHOT_MODES[snapshot_mode], 1, 1)
+
+    def variants(self, header, lines):
+        content = header + b''.join(lines)
+        return {
+            'lf': content,
+            'crlf': content.replace(b'\n', b'\r\n'),
+            'no_final_newline': content[:-1],
+        }
+
+    def test_depth(self):
+        # The block sizes split the lines and the snapshots across the blocks at various positions.
+        for block_size in [1, 7, 50, 1 << 20]:
+            tardis.READ_BLOCK_SIZE = block_size
+            for variant, content in self.variants(DEPTH_HEADER, DEPTH_LINES).items():
+                filename = self.write('depth_%s.csv.gz' % variant, content)
+                for snapshot_mode, expected in EXPECTED_DEPTH.items():
+                    data = self.read(filename, snapshot_mode)
+                    assert data.shape == (len(expected), 6), (block_size, variant, snapshot_mode)
+                    assert (data == np.asarray(expected, np.float64)).all(), (block_size, variant, snapshot_mode)
+
+    def test_trade(self):
+        for block_size in [1, 7, 1 << 20]:
+            tardis.READ_BLOCK_SIZE = block_size
+            for variant, content in self.variants(TRADE_HEADER, TRADE_LINES).items():
+                data = self.read(self.write('trades_%s.csv.gz' % variant, content))
+                assert (data == np.asarray(EXPECTED_TRADE, np.float64)).all(), (block_size, variant)
+
+    def test_invalid_row(self):
+        filename = self.write('trades.csv.gz', TRADE_HEADER + TRADE_LINES[0] + b'broken,row\n\n' + TRADE_LINES[1])
+        data = self.read(filename)
+        assert (data == np.asarray(EXPECTED_TRADE, np.float64)).all()
+
+    def test_unsupported_header(self):
+        assert self.read(self.write('unknown.csv.gz', b'a,b,c\n1,2,3\n')) is None
+
+    def test_convert(self):
+        trades = self.write('trades.csv.gz', TRADE_HEADER + b''.join(TRADE_LINES))
+        more_trades = self.write('more_trades.csv.gz', TRADE_HEADER + b'binance-futures,BTCUSDT,1,3,102,sell,10.2,2\n')
+        data = tardis.convert([trades, more_trades])
+        assert (data == np.asarray(EXPECTED_TRADE[:1] + [[TRADE_EVENT, 1, 3, -1, 10.2, 2]] + EXPECTED_TRADE[1:])).all()
+
+    def test_convert_unsupported(self):
+        data = tardis.convert([self.write('unknown.csv.gz', b'a,b,c\n1,2,3\n')])
+        assert data.shape == (0, 6)